@@ -1,32 +1,208 @@
-from datetime import datetime, timedelta
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
 import boto3
+import pandas as pd
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
+CACHE_DIR = os.path.expanduser("~/.cache/costopt")
+CACHE_TTL_HOURS = float(os.environ.get("CE_CACHE_TTL_HOURS", 6))
+THROTTLING_ERROR_CODES = ("Throttling", "ThrottlingException", "LimitExceededException")
 
-def get_cost_and_usage(sso_profile_name):
-    # Configure boto3 session with SSO profile
-    session = boto3.Session(profile_name=sso_profile_name)
+logger = logging.getLogger(__name__)
 
-    # Create Cost Explorer client
-    ce_client = session.client("ce", "us-east-1")
+CE_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+    max_pool_connections=32,
+)
 
+
+@functools.lru_cache(maxsize=32)
+def _get_ce_client(profile):
+    # One session and client per SSO profile, so repeat calls reuse the
+    # loaded service model, credentials and pooled HTTPS connections
+    return boto3.Session(profile_name=profile).client(
+        "ce", "us-east-1", config=CE_CLIENT_CONFIG
+    )
+
+
+def _cache_path(params):
+    # Cache files are keyed by a digest of the profile and request parameters
+    digest = hashlib.blake2b(
+        json.dumps(params, sort_keys=True).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return os.path.join(CACHE_DIR, f"ce_{digest}.json")
+
+
+def _read_cache(path, end_date):
+    # Return the cached ResultsByTime, or None if missing or stale.
+    # A file is stale once it is older than the TTL or was written
+    # before the current UTC day (the 30 day window has moved on).
+    # Unreadable or partially written files are treated as a miss
+    try:
+        modified = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+        if modified.date() < end_date:
+            return None
+        if datetime.now(timezone.utc) - modified > timedelta(hours=CACHE_TTL_HOURS):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _prune_cache(end_date):
+    # Cache keys include the query window, so files written before the
+    # current UTC day can never be hit again
+    for entry in os.scandir(CACHE_DIR):
+        if not (entry.name.startswith("ce_") and entry.name.endswith(".json")):
+            continue
+        modified = datetime.fromtimestamp(entry.stat().st_mtime, timezone.utc)
+        if modified.date() < end_date:
+            os.remove(entry.path)
+
+
+def _write_cache(path, results, end_date):
+    # Best effort: a cache that cannot be written (read-only or missing
+    # HOME in a container) must not lose a response that was paid for
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(results, f)
+        os.replace(tmp_path, path)
+        _prune_cache(end_date)
+    except OSError:
+        logger.warning("Could not write Cost Explorer cache %s", path, exc_info=True)
+
+
+def _results_to_frame(results, metrics, group_by):
+    # Flatten the nested ResultsByTime structure into one row per
+    # (day, group) with a column per group key and per metric
+    key_columns = [key.lower() for key in group_by]
+    rows = []
+    for day in results:
+        start = day["TimePeriod"]["Start"]
+        if group_by:
+            groups = day["Groups"]
+        else:
+            groups = [{"Keys": [], "Metrics": day["Total"]}]
+        for group in groups:
+            rows.append(
+                (
+                    start,
+                    *group["Keys"],
+                    *[float(group["Metrics"][metric]["Amount"]) for metric in metrics],
+                )
+            )
+
+    df = pd.DataFrame.from_records(rows, columns=["date", *key_columns, *metrics])
+    df["date"] = df["date"].astype("category")
+    return df
+
+
+@functools.lru_cache(maxsize=2)
+def _window(today, days=30):
+    # ISO start/end strings for the trailing window ending on a UTC day,
+    # computed once per day so every call in that day shares a cache key
+    return (today - timedelta(days=days)).isoformat(), today.isoformat()
+
+
+def get_cost_and_usage(
+    sso_profile_name,
+    metrics=("UnblendedCost",),
+    group_by=("SERVICE",),
+    granularity="DAILY",
+):
+    """
+    Retrieves the last 30 days of cost and usage for an SSO profile.
+
+    Args:
+        sso_profile_name (str): AWS config profile to query with
+        metrics (tuple, optional): Cost Explorer metrics to return.
+            Defaults to ("UnblendedCost",)
+        group_by (tuple, optional): DIMENSION keys to group by (at most two).
+            Defaults to ("SERVICE",)
+        granularity (str, optional): "DAILY" or "MONTHLY". Defaults to "DAILY"
+
+    Returns:
+        pandas.DataFrame: One row per day and group, with a categorical "date"
+            column, one column per group_by key (lower-cased) and one float64
+            column per metric. None if Cost Explorer rejects the request
+
+    Raises:
+        botocore.exceptions.ClientError: If the request is still throttled
+            after the client's adaptive retries are exhausted
+
+    Note:
+        Response size grows with days x groups x metrics, and groups are the
+        cross product of every group_by key - grouping by SERVICE and
+        USAGE_TYPE returns one entry per service/usage-type pair per day.
+        Only ask for the metrics and groupings the caller needs, and use
+        MONTHLY granularity for trend views.
+    """
     # Set the time range for the last 30 days
-    end_date = datetime.utcnow().date()
-    start_date = end_date - timedelta(days=30)
+    end_date = datetime.now(timezone.utc).date()
+    start, end = _window(end_date)
+
+    request = {
+        "TimePeriod": {"Start": start, "End": end},
+        "Granularity": granularity,
+        "Metrics": list(metrics),
+        "GroupBy": [{"Type": "DIMENSION", "Key": key} for key in group_by],
+    }
+
+    # Serve repeat runs from the local cache; every Cost Explorer
+    # request is billed
+    cache_path = _cache_path({"Profile": sso_profile_name, **request})
+    results = _read_cache(cache_path, end_date)
+    if results is not None:
+        return _results_to_frame(results, metrics, group_by)
+
+    ce_client = _get_ce_client(sso_profile_name)
 
     try:
-        # Call the AWS Cost Explorer API to get cost and usage data
-        response = ce_client.get_cost_and_usage(
-            TimePeriod={"Start": start_date.isoformat(), "End": end_date.isoformat()},
-            Granularity="DAILY",
-            Metrics=["UnblendedCost", "UsageQuantity"],
-            GroupBy=[
-                {"Type": "DIMENSION", "Key": "SERVICE"},
-                {"Type": "DIMENSION", "Key": "USAGE_TYPE"},
-            ],
-        )
+        # Call the AWS Cost Explorer API to get cost and usage data.
+        # botocore ships no paginator for get_cost_and_usage, so follow
+        # NextPageToken by hand until every page has been collected
+        results = []
+        while True:
+            response = ce_client.get_cost_and_usage(**request)
+            results.extend(response["ResultsByTime"])
+            if not response.get("NextPageToken"):
+                break
+            request["NextPageToken"] = response["NextPageToken"]
 
-        return response["ResultsByTime"]
+        _write_cache(cache_path, results, end_date)
+        return _results_to_frame(results, metrics, group_by)
 
-    except Exception as e:
-        print(f"An error occurred: {str(e)}")
+    except ClientError as e:
+        # Throttling has already been retried by the adaptive retry mode;
+        # surface it rather than returning an empty result
+        if e.response["Error"]["Code"] in THROTTLING_ERROR_CODES:
+            raise
+        logger.exception("Cost Explorer request failed for %s", sso_profile_name)
         return None
+
+
+async def get_cost_and_usage_async(sso_profile_name, **kwargs):
+    # Run the blocking boto3 call on a worker thread so several profiles
+    # can wait on Cost Explorer at the same time
+    return await asyncio.to_thread(get_cost_and_usage, sso_profile_name, **kwargs)
+
+
+def gather_all(profiles, **kwargs):
+    # Fetch cost and usage for every profile concurrently and return a
+    # dict of profile name -> DataFrame (None where the call failed)
+    async def _gather():
+        return await asyncio.gather(
+            *[get_cost_and_usage_async(profile, **kwargs) for profile in profiles]
+        )
+
+    return dict(zip(profiles, asyncio.run(_gather())))
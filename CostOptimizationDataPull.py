@@ -13,16 +13,22 @@ The module supports multiple types of cost findings including:
 - Unattached EBS volumes
 """
 
-import hashlib
-import multiprocessing
+import functools
+import itertools
 import os
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 
 import boto3
+import cachetools.func
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.fs
 import streamlit as st
+import xxhash
 from streamlit import session_state as ss
 
 from dateutil.relativedelta import relativedelta
@@ -30,7 +36,7 @@ from dateutil.relativedelta import relativedelta
 from SSOGetCredentials import (
     get_account_names,
     get_accounts,
-    map_accountid_to_name,
+    aname_sanitizer,
     check_token_time,
 )
 if os.environ.get('ENVIRONMENT') == 'DEV':
@@ -45,13 +51,22 @@ else:
 ACCOUNT = "HF-Payer"
 S3_ACCOUNT = "hf-development"
 S3_BUCKET = "hf-io-dev-costtracking"
-TMP_TRACKER_INPROGRESS = "/tmp/CostTrackerInProgress.parquet"
-TMP_TRACKER_COMPLETE = "/tmp/CostTracker_Complete.parquet"
-TMP_TRACKER_EXEMPT = "/tmp/CostTracker_Exempt.parquet"
+S3_REGION = "us-east-1"
 STATUS_IMPORT = True
 TRACKER_FILE = "/mnt/local/10-CostTracker.xlsx"
 OUTPUT_FILE = "/tmp/Scratch-CostRecommendationFindings.xlsx"
 SHEET_NAME = "Cost Tracker Summary"
+# Tracker parquet files are shipped to S3 on every save, so keep them small
+PARQUET_WRITE_OPTIONS = {
+    "engine": "pyarrow",
+    "compression": "snappy",
+    "row_group_size": 50_000,
+    "use_dictionary": True,
+}
+# Upper bound on accounts scanned at once; the work is AWS API latency bound
+MAX_ACCOUNT_WORKERS = 16
+# describe_volumes accepts at most 500 volume ids per request
+DESCRIBE_VOLUMES_BATCH = 500
 
 DF_TYPE_DICT = {
     "ResourceId": str,
@@ -69,6 +84,108 @@ DF_TYPE_DICT = {
     "Resource ID + Type": str,
 }
 
+# Savings Type values (lower-cased) behind each savings rollup category
+IDLE_STYPES = frozenset(
+    [
+        "unattached ebs",
+        "idle",
+        "idle rds",
+        "idle ec2",
+        "idle dms",
+        "idle lambda",
+        "stop",
+        "stopped ec2 instance",
+        "s3 lifecycle policy",
+    ]
+)
+RESERVATION_STYPES = frozenset(
+    ["purchasereservedinstances", "purchasesavingsplans", "savinsplanspurchase"]
+)
+RIGHTSIZE_STYPES = frozenset(["rightsize", "upgrade", "rightsize ebs", "rightsizing"])
+
+# st.data_editor column config shared by the tracker pages
+TRACKER_COL_CONFIG = {
+    "DateOfSavings": st.column_config.DateColumn(
+        "DateOfSavings", min_value=date(2022, 1, 1), format="MM-DD-YYYY", step=1
+    ),
+    "FinOpsLastModified": st.column_config.DateColumn(
+        "FinOpsLastModified", min_value=date(2022, 1, 1), format="MM-DD-YYYY", step=1
+    ),
+}
+
+# Session state key each tracker is kept under
+TRACKER_STATE_KEYS = {
+    "inprogress": "tracker_df",
+    "complete": "ctracker_df",
+    "exempt": "extracker_df",
+}
+# Process-wide tracker versions. write_tracker moves a tracker to a new
+# version on every upload, so sessions holding an older copy reload it
+_TRACKER_WRITES = itertools.count(1)
+_TRACKER_VERSIONS = dict.fromkeys(TRACKER_STATE_KEYS, 0)
+
+# Tracker statuses that import_status does not carry over to new findings
+TERMINAL_STATUSES = frozenset(
+    {"needs research", "complete", "completed", "archived", "archive"}
+)
+
+# describe_instance_types accepts at most 100 instance types per request
+DESCRIBE_INSTANCE_TYPES_BATCH = 100
+# Instance type -> (vCPUs, RAM in GB), filled by instance_type_specs
+INSTANCE_TYPE_SPECS = {}
+
+# Finding fields read by parse_findings; not every source sets all of them
+FINDING_SOURCE_COLUMNS = [
+    "resourceId",
+    "ResourceId",
+    "RecommendationId",
+    "accountId",
+    "Account",
+    "Name",
+    "estimatedMonthlySavings",
+    "actionType",
+    "currentResourceType",
+    "currentResourceSummary",
+    "recommendedResourceSummary",
+    "Cost Center",
+    "Service Group",
+    "Optimization Exemption",
+]
+
+# Column types of the summary records built by parse_findings
+SUMMARY_SCHEMA = pa.schema(
+    [
+        ("ResourceId", pa.string()),
+        ("RecommendationId", pa.string()),
+        ("FinOpsStatus", pa.string()),
+        ("FinOpsLastModified", pa.date32()),
+        ("Comments", pa.string()),
+        ("Account", pa.string()),
+        ("Name", pa.string()),
+        ("estimatedMonthlySavings", pa.float64()),
+        ("Savings Type", pa.string()),
+        ("Cost Center", pa.string()),
+        ("Service Group", pa.string()),
+        ("Optimization Exemption", pa.string()),
+    ]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _session(profile):
+    """Return the boto3 Session for a profile, built once per process"""
+    return boto3.Session(profile_name=profile)
+
+
+@functools.lru_cache(maxsize=None)
+def _client(profile, service, region="us-east-1"):
+    """
+    Return a boto3 client for a profile and service, built once per process.
+    Build clients on the script thread: boto3 Sessions are not thread-safe,
+    but the finished clients are and can be handed to worker threads
+    """
+    return _session(profile).client(service, region)
+
 
 def parse_findings(aggs, itemlist):
     """
@@ -99,105 +216,115 @@ def parse_findings(aggs, itemlist):
           type details including CPU cores and RAM for EC2 instances
         - For EBS volume recommendations, the function includes volume type transition details
         - The function sanitizes the output by handling None values and nested dictionaries
+        - Findings are processed as DataFrame columns rather than item by item
     """
 
-    session = boto3.Session(profile_name=ACCOUNT)
-    ec2_client = session.client("ec2", "us-east-1")
-    # Order of Operations
-    # For each current finding in aggs
-    # Reconcile if the finding is New, or existing
-    # First check if recommendation ID exists
-    record = {}
-    record["FinOpsStatus"] = "Needs Research"
-    record["FinOpsLastModified"] = date.today()
-    record["Comments"] = ""
-
-    for item in itemlist:
-        agg = {}
-        if item.get("resourceId") is None:
-            if item.get("ResourceId") is None:
-                # Only way this is true is if it's coming from Cost Opt Hub -
-                # i.e Savings Plans/Reservations
-                resid = item["RecommendationId"]
-            else:
-                resid = item["ResourceId"]
-        else:
-            resid = item["resourceId"]
+    if len(itemlist) == 0:
+        return aggs
 
-        agg["ResourceId"] = resid
-        agg["RecommendationId"] = item["RecommendationId"]
-        # st.write('Lookup on Recommendation Id ' + agg['RecommendationId'])
-        # record = find_record(ef, agg['RecommendationId'], agg['ResourceId'], agg['Savings Type'])
-        agg["FinOpsStatus"] = record["FinOpsStatus"]
+    items = pd.DataFrame.from_records(itemlist)
+    items = items.reindex(
+        columns=items.columns.union(FINDING_SOURCE_COLUMNS, sort=False)
+    )
 
-        agg["FinOpsLastModified"] = record["FinOpsLastModified"]
-        agg["Comments"] = record["Comments"]
+    df = pd.DataFrame(index=items.index)
+    # Cost Opt Hub Savings Plans/Reservations carry no resource id, so fall
+    # back to the recommendation id
+    df["ResourceId"] = (
+        items["resourceId"]
+        .fillna(items["ResourceId"])
+        .fillna(items["RecommendationId"])
+    )
+    df["RecommendationId"] = items["RecommendationId"]
+    df["FinOpsStatus"] = "Needs Research"
+    df["FinOpsLastModified"] = date.today()
+    df["Comments"] = ""
+    df["Account"] = items["accountId"].fillna(items["Account"])
+    df["Name"] = items["Name"]
+    df["estimatedMonthlySavings"] = items["estimatedMonthlySavings"].astype(float)
+    df["Savings Type"] = items["actionType"]
+
+    rightsize = df["Savings Type"].eq("Rightsize")
+    ebs = rightsize & items["currentResourceType"].eq("EbsVolume")
+    if ebs.any():
+        df.loc[ebs, "Comments"] = (
+            items.loc[ebs, "currentResourceSummary"]
+            + "->"
+            + items.loc[ebs, "recommendedResourceSummary"]
+        )
+    ec2 = rightsize & items["currentResourceType"].eq("Ec2Instance")
+    if ec2.any():
+        current = items.loc[ec2, "currentResourceSummary"]
+        recommended = items.loc[ec2, "recommendedResourceSummary"]
+        specs = instance_type_specs(set(current) | set(recommended))
+        df.loc[ec2, "Comments"] = [
+            rightsize_comment(specs, current_type, recommended_type)
+            for current_type, recommended_type in zip(current, recommended)
+        ]
 
-        if item.get("accountId") is not None:
-            agg["Account"] = item.get("accountId")
-        else:
-            agg["Account"] = item.get("Account")
-
-        agg["Name"] = item.get("Name")
-        agg["estimatedMonthlySavings"] = float(
-            item.get("estimatedMonthlySavings"))
-        agg["Savings Type"] = item.get("actionType")
-        if (agg["FinOpsStatus"] == "Needs Research") and (
-            agg["Savings Type"] == "Rightsize"
-        ):
-            if item["currentResourceType"] == "Ec2Instance":
-                r = ec2_client.describe_instance_types(
-                    InstanceTypes=[item.get("currentResourceSummary")]
-                )
-                fromstring = (
-                    item.get("currentResourceSummary")
-                    + "("
-                    + str(r["InstanceTypes"][0]["VCpuInfo"]["DefaultVCpus"])
-                    + "Cores / RAM:"
-                    + str(r["InstanceTypes"][0]
-                          ["MemoryInfo"]["SizeInMiB"] / 1024)
-                    + "GB)"
-                )
-                r = ec2_client.describe_instance_types(
-                    InstanceTypes=[item.get("recommendedResourceSummary")]
-                )
-                tostring = (
-                    item.get("recommendedResourceSummary")
-                    + "("
-                    + str(r["InstanceTypes"][0]["VCpuInfo"]["DefaultVCpus"])
-                    + " Cores / RAM: "
-                    + str(r["InstanceTypes"][0]
-                          ["MemoryInfo"]["SizeInMiB"] / 1024)
-                    + "GB)"
-                )
-                agg["Comments"] = fromstring + \
-                    "->" + tostring + agg["Comments"]
-            elif item["currentResourceType"] == "EbsVolume":
-                agg["Comments"] = (
-                    item.get("currentResourceSummary")
-                    + "->"
-                    + item.get("recommendedResourceSummary")
-                    + agg["Comments"]
-                )
-        agg["Cost Center"] = item.get("Cost Center")
-        agg["Service Group"] = item.get("Service Group")
-        agg["Optimization Exemption"] = item.get("Optimization Exemption")
-        for key, value in agg.items():
-            if isinstance(value, dict):
-                agg[key] = value["S"]
-            elif value is None:
-                agg[key] = ""
-
-        aggs.append(agg.copy())
+    df["Cost Center"] = items["Cost Center"]
+    df["Service Group"] = items["Service Group"]
+    df["Optimization Exemption"] = items["Optimization Exemption"]
+
+    # Unwrap {"S": value} attribute dicts and blank out missing values
+    for column in df.select_dtypes(include="object").columns:
+        df[column] = df[column].map(lambda v: v["S"] if isinstance(v, dict) else v)
+    text_columns = df.columns.drop(["FinOpsLastModified", "estimatedMonthlySavings"])
+    df[text_columns] = df[text_columns].fillna("")
+
+    aggs.extend(df.to_dict("records"))
     return aggs
 
 
-def parse_findings_chunk(args):
-    """'
-    Perform Parse Findings per chunk of recommendations
+def instance_type_specs(instance_types):
+    """
+    Looks up vCPU and memory details for a set of EC2 instance types.
+
+    Args:
+        instance_types (iterable): Instance type names to resolve
+
+    Returns:
+        dict: Instance type -> (default vCPUs, RAM in GB)
+
+    Note:
+        Results are kept in INSTANCE_TYPE_SPECS for the life of the process, and
+        unknown types are resolved with one describe_instance_types call per
+        100 types instead of one call per finding
+    """
+    missing = sorted(set(instance_types) - INSTANCE_TYPE_SPECS.keys())
+    if missing:
+        ec2_client = _client(ACCOUNT, "ec2")
+        for i in range(0, len(missing), DESCRIBE_INSTANCE_TYPES_BATCH):
+            r = ec2_client.describe_instance_types(
+                InstanceTypes=missing[i: i + DESCRIBE_INSTANCE_TYPES_BATCH]
+            )
+            for itype in r["InstanceTypes"]:
+                INSTANCE_TYPE_SPECS[itype["InstanceType"]] = (
+                    itype["VCpuInfo"]["DefaultVCpus"],
+                    itype["MemoryInfo"]["SizeInMiB"] / 1024,
+                )
+    return {itype: INSTANCE_TYPE_SPECS[itype] for itype in instance_types}
+
+
+def rightsize_comment(specs, current_type, recommended_type):
     """
-    aggregation, chunk = args
-    return parse_findings(aggregation, chunk)
+    Builds the comment describing an EC2 rightsizing transition.
+
+    Args:
+        specs (dict): Instance type -> (vCPUs, RAM in GB), see instance_type_specs
+        current_type (str): Current instance type
+        recommended_type (str): Recommended instance type
+
+    Returns:
+        str: Comment such as "m5.xlarge(4Cores / RAM:16.0GB)->m5.large(2 Cores / RAM: 8.0GB)"
+    """
+    cores, ram = specs[current_type]
+    fromstring = current_type + "(" + str(cores) + "Cores / RAM:" + str(ram) + "GB)"
+    cores, ram = specs[recommended_type]
+    tostring = (
+        recommended_type + "(" + str(cores) + " Cores / RAM: " + str(ram) + "GB)"
+    )
+    return fromstring + "->" + tostring
 
 
 def build_savings_date_column(tracker_df):
@@ -210,16 +337,17 @@ def build_savings_date_column(tracker_df):
     Returns:
         pandas.DataFrame: DataFrame with new DateOfSavings column populated
     """
-    tracker_df.insert(2, "DateOfSavings", None, allow_duplicates=False)
-    for index, row in tracker_df.iterrows():
-        if type(tracker_df.loc[index, "FinOpsStatus"]) == str:
-            if tracker_df.loc[index, "FinOpsStatus"].lower() == "complete":
-                tracker_df.loc[index, "DateOfSavings"] = tracker_df.loc[
-                    index, "FinOpsLastModified"
-                ]
+    complete = tracker_df["FinOpsStatus"].astype(str).str.lower().eq("complete")
+    tracker_df.insert(
+        2,
+        "DateOfSavings",
+        tracker_df["FinOpsLastModified"].where(complete),
+        allow_duplicates=False,
+    )
     return tracker_df
 
 
+@cachetools.func.ttl_cache(maxsize=64, ttl=30)
 def file_modified_recently(file_path, minutes=1440):
     """
     Checks if a file has been modified within the specified time period.
@@ -232,20 +360,19 @@ def file_modified_recently(file_path, minutes=1440):
         bool: True if file was modified within specified minutes, False otherwise
 
     Note:
-        Returns False if file doesn't exist or is inaccessible
+        Returns False if file doesn't exist or is inaccessible.
+        Results are cached for 30 seconds, so call file_modified_recently.cache_clear()
+        after rewriting a file that is checked here
     """
-    # Get the current time
-    current_time = time.time()
-
     # Get the last modification time of the file
     try:
-        file_mod_time = os.path.getmtime(file_path)
+        file_stat = os.stat(file_path)
     except OSError:
         # File doesn't exist or is inaccessible
         return False
 
     # Calculate the time difference in minutes
-    time_difference = (current_time - file_mod_time) / 60
+    time_difference = (time.time() - file_stat.st_mtime) / 60
 
     # Check if the file was modified within the last 15 minutes
     return time_difference <= minutes
@@ -263,64 +390,69 @@ def split_inprogress_complete(df):
             - idf: DataFrame containing in-progress records
             - cdf: DataFrame containing completed records
 
+    Raises:
+        AttributeError: If any record has no FinOpsStatus
+
     Note:
         Records are split based on FinOpsStatus field, with 'complete' and 'exempt'
-        status going to the completed DataFrame
-    """
-
-    idf = pd.DataFrame(
-        columns=[
-            "ResourceId",
-            "RecommendationId",
-            "DateOfSavings",
-            "FinOpsStatus",
-            "FinOpsLastModified",
-            "Comments",
-            "Account",
-            "estimatedMonthlySavings",
-            "Savings Type",
-            "Cost Center",
-            "Service Group",
-            "Optimization Exemption",
-            "Resource ID + Type",
-        ]
-    )
-    cdf = pd.DataFrame(
-        columns=[
-            "ResourceId",
-            "RecommendationId",
-            "DateOfSavings",
-            "FinOpsStatus",
-            "FinOpsLastModified",
-            "Comments",
-            "Account",
-            "estimatedMonthlySavings",
-            "Savings Type",
-            "Cost Center",
-            "Service Group",
-            "Optimization Exemption",
-            "Resource ID + Type",
-        ]
-    )
-    df = df.replace("nan", None)
-    df = df.replace("NaN", None)
-    idf = idf.astype(DF_TYPE_DICT)
-    cdf = cdf.astype(DF_TYPE_DICT)
-
-    for index, row in df.iterrows():
-        if (
-            df.loc[index, "FinOpsStatus"].lower() == "complete"
-            or df.loc[index, "FinOpsStatus"].lower() == "exempt"
-        ):
-            cdf.loc[len(cdf)] = df.loc[index].copy()
-        else:
-            idf.loc[len(idf)] = df.loc[index].copy()
-    #    idf = idf.replace({np.nan: None})
-    #    cdf = cdf.replace({np.nan: None})
+        status going to the completed DataFrame. Only the tracker columns in
+        DF_TYPE_DICT are kept, and the original index and dtypes are preserved
+    """
+
+    columns = [column for column in DF_TYPE_DICT if column in df.columns]
+
+    status = df["FinOpsStatus"].str.lower()
+    if status.isna().any():
+        raise AttributeError("FinOpsStatus is missing for one or more records")
+    complete = status.isin(["complete", "exempt"])
+
+    idf = df.loc[~complete, columns]
+    cdf = df.loc[complete, columns]
     return idf, cdf
 
 
-def ingest_tracker(tracker_type="inprogress", s3=False):
+def s3_filesystem():
+    """
+    Builds a pyarrow S3 filesystem for the tracker bucket.
+
+    Returns:
+        pyarrow.fs.S3FileSystem: Filesystem signed with the S3_ACCOUNT credentials
+
+    Note:
+        Built on every call rather than once at import, since the SSO
+        credentials behind the session expire and are not available until
+        after login
+    """
+    creds = _session(S3_ACCOUNT).get_credentials().get_frozen_credentials()
+    return pyarrow.fs.S3FileSystem(
+        access_key=creds.access_key,
+        secret_key=creds.secret_key,
+        session_token=creds.token,
+        region=S3_REGION,
+    )
+
+
+def _fetch_tracker(tracker_type):
+    # Uncached S3 read, for callers that write the tracker back
+    fs = s3_filesystem()
+    if tracker_type == "inprogress":
+        df = pd.read_parquet(f"{S3_BUCKET}/{S3_TRACKER_INPROGRESS}", filesystem=fs)
+    elif tracker_type == "complete":
+        df = pd.read_parquet(f"{S3_BUCKET}/{S3_TRACKER_COMPLETE}", filesystem=fs)
+    elif tracker_type == "exempt":
+        df = pd.read_parquet(f"{S3_BUCKET}/{S3_TRACKER_EXEMPT}", filesystem=fs)
+    return df
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _read_tracker(tracker_type):
+    # Display reads are shared by every session on this server for five
+    # minutes; write_tracker clears this cache so a save is seen on the next
+    # read. Writes from other processes are only seen once the TTL expires
+    return _fetch_tracker(tracker_type)
+
+
+def ingest_tracker(tracker_type="inprogress", s3=False, fresh=False):
     """
     Reads and processes the Cost Tracker data from either local Excel file or S3.
 
@@ -329,13 +461,16 @@ def ingest_tracker(tracker_type="inprogress", s3=False):
             Defaults to "inprogress"
         s3 (bool, optional): Whether to read from S3 (True) or local file (False).
             Defaults to False
+        fresh (bool, optional): Bypass the shared read cache and read S3 directly.
+            Defaults to False
 
     Returns:
         pandas.DataFrame: Processed tracker data
 
     Note:
         When reading from local file, function splits data into inprogress and complete
-        trackers and writes both to storage
+        trackers and writes both to storage. Anything that writes the tracker back must
+        pass fresh=True, otherwise it may merge into, and overwrite, a stale copy
     """
 
     if not s3:
@@ -347,30 +482,105 @@ def ingest_tracker(tracker_type="inprogress", s3=False):
         write_tracker(idf, tracker_type="inprogress")
         write_tracker(cdf, tracker_type="complete")
     else:
-        session = boto3.Session(profile_name=S3_ACCOUNT)
-        s3_client = session.client("s3", "us-east-1")
-        if tracker_type == "inprogress":
-            s3_client.download_file(
-                S3_BUCKET, S3_TRACKER_INPROGRESS, TMP_TRACKER_INPROGRESS
-            )
-            df = pd.read_parquet(TMP_TRACKER_INPROGRESS)
-        elif tracker_type == "complete":
-            s3_client.download_file(
-                S3_BUCKET, S3_TRACKER_COMPLETE, TMP_TRACKER_COMPLETE
-            )
-            df = pd.read_parquet(TMP_TRACKER_COMPLETE)
-        elif tracker_type == "exempt":
-            s3_client.download_file(
-                S3_BUCKET, S3_TRACKER_EXEMPT, TMP_TRACKER_EXEMPT
-            )
-            df = pd.read_parquet(TMP_TRACKER_EXEMPT)
+        df = _fetch_tracker(tracker_type) if fresh else _read_tracker(tracker_type)
     return df
 
 
+def load_session_tracker(tracker_type="inprogress"):
+    """
+    Loads a tracker from S3 into session state unless the session copy is current.
+
+    Args:
+        tracker_type (str, optional): Type of tracker ('inprogress', 'complete' or 'exempt').
+            Defaults to "inprogress"
+
+    Returns:
+        pandas.DataFrame: The session state copy of the tracker
+
+    Note:
+        Edits are written back by row label, so a session must not keep a copy
+        once any session has saved that tracker; write_tracker bumps the version
+        this compares against
+    """
+    state_key = TRACKER_STATE_KEYS[tracker_type]
+    versions = ss.setdefault("tracker_versions", {})
+    # Read the version before the tracker so a save racing this load is
+    # picked up on the next run rather than missed
+    current = _TRACKER_VERSIONS[tracker_type]
+    if state_key not in ss or versions.get(tracker_type) != current:
+        ss[state_key] = ingest_tracker(tracker_type=tracker_type, s3=True)
+        versions[tracker_type] = current
+    return ss[state_key]
+
+
 # I think I need to split modify_tracker for the inprogress tracker, and the completed tracker.
 # This is getting too complicated
 
 
+def apply_tracker_edits(df, edited_rows):
+    """
+    Applies st.data_editor edits to a tracker DataFrame in place.
+
+    Args:
+        df (pandas.DataFrame): Tracker DataFrame shown in the data editor
+        edited_rows (dict): The editor's "edited_rows" mapping of
+            row index -> {column: new value}
+
+    Returns:
+        pandas.Index: Index labels of the modified rows
+
+    Note:
+        Edits are written one column at a time rather than one cell at a time.
+        Cleared cells (None) are written too, which DataFrame.update would skip.
+        DateOfSavings strings from the editor are parsed to dates, and
+        FinOpsLastModified is stamped with today's date on every modified row
+    """
+    modified = pd.Index(list(edited_rows.keys()))
+    columns = {column for edits in edited_rows.values() for column in edits}
+    for column in columns:
+        rows = [index for index, edits in edited_rows.items() if column in edits]
+        values = [edited_rows[index][column] for index in rows]
+        if column == "DateOfSavings":
+            values = [
+                datetime.strptime(value, "%Y-%m-%d").date()
+                if isinstance(value, str)
+                else value
+                for value in values
+            ]
+        df.loc[rows, column] = values
+    df.loc[modified, "FinOpsLastModified"] = date.today()
+    return modified
+
+
+def merge_tracker_edits(local_df, edited_rows, s3_df):
+    """
+    Applies data editor edits to a local tracker and merges them into the S3 copy.
+
+    Args:
+        local_df (pandas.DataFrame): Tracker DataFrame shown in the data editor
+        edited_rows (dict): The editor's "edited_rows" mapping
+        s3_df (pandas.DataFrame): Freshly ingested S3 copy of the same tracker
+
+    Returns:
+        tuple: Contains:
+            - s3_df: S3 tracker with the accepted edits applied and DeleteMe rows removed
+            - unwritten_indexes: List of indexes whose S3 record is newer than the edit
+    """
+    modified = apply_tracker_edits(local_df, edited_rows)
+    local = local_df.loc[modified]
+    s3_modified = pd.to_datetime(s3_df["FinOpsLastModified"].reindex(modified))
+    writable = (
+        s3_modified.isna() | (pd.to_datetime(local["FinOpsLastModified"]) >= s3_modified)
+    ).to_numpy()
+
+    written = modified[writable]
+    s3_df = s3_df.reindex(s3_df.index.union(written))
+    s3_df.loc[written] = local.loc[written]
+    deleted = modified[local["FinOpsStatus"].eq("DeleteMe").to_numpy()]
+    s3_df = s3_df.drop(deleted, errors="ignore")
+    return s3_df, list(modified[~writable])
+
+
 def modify_inprogress_tracker():
     """
     Modifies the in-progress tracker based on edited rows and handles status transitions.
@@ -383,34 +593,43 @@ def modify_inprogress_tracker():
         list: List of indexes that could not be written due to modification conflicts
     """
 
-    s3_i_df = ingest_tracker(tracker_type="inprogress", s3=True)
-    s3_c_df = ingest_tracker(tracker_type="complete", s3=True)
-    s3_ex_df = ingest_tracker(tracker_type="exempt", s3=True)
+    # A Save with no edits has nothing to merge, so skip the S3 round trip
+    if not ss.ietracker["edited_rows"]:
+        return
+
+    # Read on the script thread: the S3 credentials come from a shared boto3
+    # Session, which is not thread-safe
+    s3_i_df = ingest_tracker(tracker_type="inprogress", s3=True, fresh=True)
+    s3_c_df = ingest_tracker(tracker_type="complete", s3=True, fresh=True)
+    s3_ex_df = ingest_tracker(tracker_type="exempt", s3=True, fresh=True)
     st.markdown("### Detected the following changes:")
     st.write(ss.ietracker["edited_rows"])
-    modified_indexes = ss.ietracker["edited_rows"].keys()
-    for index in modified_indexes:
-        columns = ss.ietracker["edited_rows"][index].keys()
-        for column in columns:
-            ss.tracker_df.loc[index, column] = ss.ietracker["edited_rows"][index][
-                column
-            ]
-        ss.tracker_df.loc[index, "FinOpsLastModified"] = date.today()
-
-    for index in modified_indexes:
-        s3_i_df.loc[index] = ss.tracker_df.loc[index]
-        if ss.tracker_df.loc[index, "FinOpsStatus"].lower() == "complete":
-            ss.tracker_df.loc[index, "DateOfSavings"] = date.today()
-            s3_c_df.loc[len(s3_c_df)] = ss.tracker_df.loc[index]
-            st.write(f"Dropping the following Row: {s3_i_df.loc[index]}")
-            s3_i_df = s3_i_df.drop([index])
-        elif ss.tracker_df.loc[index, "FinOpsStatus"].lower() == "exempt":
-            s3_ex_df.loc[len(s3_ex_df)] = ss.tracker_df.loc[index]
-            st.write(f"Dropping the following Row: {s3_i_df.loc[index]}")
-            s3_i_df = s3_i_df.drop([index])
-        elif ss.tracker_df.loc[index, "FinOpsStatus"] == "DeleteMe":
-            st.write(f"Dropping the following Row: {s3_i_df.loc[index]}")
-            s3_i_df = s3_i_df.drop([index])
+    modified = apply_tracker_edits(ss.tracker_df, ss.ietracker["edited_rows"])
+
+    s3_i_df = s3_i_df.reindex(s3_i_df.index.union(modified))
+    s3_i_df.loc[modified] = ss.tracker_df.loc[modified]
+
+    status = ss.tracker_df.loc[modified, "FinOpsStatus"]
+    lowered = status.str.lower()
+    completed = modified[lowered.eq("complete").to_numpy()]
+    exempted = modified[lowered.eq("exempt").to_numpy()]
+    deleted = modified[status.eq("DeleteMe").to_numpy()]
+
+    ss.tracker_df.loc[completed, "DateOfSavings"] = date.today()
+    s3_c_df = pd.concat(
+        [s3_c_df, ss.tracker_df.loc[completed].reindex(columns=s3_c_df.columns)],
+        ignore_index=True,
+    )
+    s3_ex_df = pd.concat(
+        [s3_ex_df, ss.tracker_df.loc[exempted].reindex(columns=s3_ex_df.columns)],
+        ignore_index=True,
+    )
+
+    dropped = completed.union(exempted).union(deleted)
+    if len(dropped) > 0:
+        st.write("Dropping the following Rows:")
+        st.write(s3_i_df.loc[dropped])
+    s3_i_df = s3_i_df.drop(dropped)
 
     write_tracker(s3_i_df, tracker_type="inprogress", s3=True)
     write_tracker(s3_c_df, tracker_type="complete", s3=True)
@@ -427,34 +646,15 @@ def modify_complete_tracker():
     Returns:
         list: List of indexes that could not be written due to modification conflicts
     """
-    s3_c_df = ingest_tracker(tracker_type="complete", s3=True)
-    modified_indexes = ss.cetracker["edited_rows"].keys()
+    # A Save with no edits has nothing to merge, so skip the S3 round trip
+    if not ss.cetracker["edited_rows"]:
+        return []
+    s3_c_df = ingest_tracker(tracker_type="complete", s3=True, fresh=True)
     st.markdown("### Detected the following changes:")
     st.write(ss.cetracker["edited_rows"])
-    for index in modified_indexes:
-        columns = ss.cetracker["edited_rows"][index].keys()
-        for column in columns:
-            ss.ctracker_df.loc[index, column] = ss.cetracker["edited_rows"][index][
-                column
-            ]
-    unwritten_indexes = []
-    for index in modified_indexes:
-        if type(ss.ctracker_df.loc[index, "DateOfSavings"]) == str:
-            ss.ctracker_df.loc[index, "DateOfSavings"] = datetime.strptime(
-                ss.ctracker_df.loc[index, "DateOfSavings"], "%Y-%m-%d"
-            ).date()
-        ss.ctracker_df.loc[index, "FinOpsLastModified"] = date.today()
-        if s3_c_df.loc[index, "FinOpsLastModified"] is None:
-            s3_c_df.loc[index] = ss.ctracker_df.loc[index]
-        elif (
-            ss.ctracker_df.loc[index, "FinOpsLastModified"]
-            >= s3_c_df.loc[index, "FinOpsLastModified"]
-        ):
-            s3_c_df.loc[index] = ss.ctracker_df.loc[index]
-        else:
-            unwritten_indexes.append(index)
-        if ss.ctracker_df.loc[index, "FinOpsStatus"] == "DeleteMe":
-            s3_c_df = s3_c_df.drop([index])
+    s3_c_df, unwritten_indexes = merge_tracker_edits(
+        ss.ctracker_df, ss.cetracker["edited_rows"], s3_c_df
+    )
     write_tracker(s3_c_df, tracker_type="complete", s3=True)
     return unwritten_indexes
 
@@ -469,34 +669,15 @@ def modify_exempt_tracker():
     Returns:
         list: List of indexes that could not be written due to modification conflicts
     """
-    s3_e_df = ingest_tracker(tracker_type="exempt", s3=True)
-    modified_indexes = ss.eextracker["edited_rows"].keys()
+    # A Save with no edits has nothing to merge, so skip the S3 round trip
+    if not ss.eextracker["edited_rows"]:
+        return []
+    s3_e_df = ingest_tracker(tracker_type="exempt", s3=True, fresh=True)
     st.markdown("### Detected the following changes:")
     st.write(ss.eextracker["edited_rows"])
-    for index in modified_indexes:
-        columns = ss.eextracker["edited_rows"][index].keys()
-        for column in columns:
-            ss.extracker_df.loc[index, column] = ss.eextracker["edited_rows"][index][
-                column
-            ]
-    unwritten_indexes = []
-    for index in modified_indexes:
-        if type(ss.extracker_df.loc[index, "DateOfSavings"]) == str:
-            ss.extracker_df.loc[index, "DateOfSavings"] = datetime.strptime(
-                ss.extracker_df.loc[index, "DateOfSavings"], "%Y-%m-%d"
-            ).date()
-        ss.extracker_df.loc[index, "FinOpsLastModified"] = date.today()
-        if s3_e_df.loc[index, "FinOpsLastModified"] is None:
-            s3_e_df.loc[index] = ss.extracker_df.loc[index]
-        elif (
-            ss.extracker_df.loc[index, "FinOpsLastModified"]
-            >= s3_e_df.loc[index, "FinOpsLastModified"]
-        ):
-            s3_e_df.loc[index] = ss.extracker_df.loc[index]
-        else:
-            unwritten_indexes.append(index)
-        if ss.extracker_df.loc[index, "FinOpsStatus"] == "DeleteMe":
-            s3_e_df = s3_e_df.drop([index])
+    s3_e_df, unwritten_indexes = merge_tracker_edits(
+        ss.extracker_df, ss.eextracker["edited_rows"], s3_e_df
+    )
     write_tracker(s3_e_df, tracker_type="exempt", s3=True)
     return unwritten_indexes
 
@@ -511,10 +692,9 @@ def convert_dates(df):
     Returns:
         pandas.DataFrame: DataFrame with datetime columns converted to date objects
     """
-    for col in df.columns:
-        if df[col].dtype == "datetime64[ns]":
-            st.write(col)
-            df[col] = df[col].dt.date
+    # select_dtypes matches every datetime64 resolution, not just [ns]
+    for col in df.select_dtypes(include="datetime64").columns:
+        df[col] = df[col].dt.date
     return df
 
 
@@ -540,26 +720,36 @@ def write_tracker(df, tracker_type="inprogress", s3=True):
     if not s3:
         df.to_excel(TRACKER_FILE, index=False)
     else:
-        session = boto3.Session(profile_name=S3_ACCOUNT)
         df = convert_dates(df)
         df = df.reset_index(drop=True)
-        s3_client = session.client("s3", "us-east-1")
+        fs = s3_filesystem()
         if tracker_type == "inprogress":
-            df.to_parquet(TMP_TRACKER_INPROGRESS)
-            s3_client.upload_file(
-                TMP_TRACKER_INPROGRESS, S3_BUCKET, S3_TRACKER_INPROGRESS
+            df.to_parquet(
+                f"{S3_BUCKET}/{S3_TRACKER_INPROGRESS}",
+                filesystem=fs,
+                **PARQUET_WRITE_OPTIONS,
             )
             ss.tracker_df = df.copy()
         elif tracker_type == "complete":
-            df.to_parquet(TMP_TRACKER_COMPLETE)
-            s3_client.upload_file(TMP_TRACKER_COMPLETE,
-                                  S3_BUCKET, S3_TRACKER_COMPLETE)
+            df.to_parquet(
+                f"{S3_BUCKET}/{S3_TRACKER_COMPLETE}",
+                filesystem=fs,
+                **PARQUET_WRITE_OPTIONS,
+            )
             ss.ctracker_df = df.copy()
         elif tracker_type == "exempt":
-            df.to_parquet(TMP_TRACKER_EXEMPT)
-            s3_client.upload_file(TMP_TRACKER_EXEMPT,
-                                  S3_BUCKET, S3_TRACKER_EXEMPT)
+            df.to_parquet(
+                f"{S3_BUCKET}/{S3_TRACKER_EXEMPT}",
+                filesystem=fs,
+                **PARQUET_WRITE_OPTIONS,
+            )
             ss.extracker_df = df.copy()
+        _read_tracker.clear()
+        # Bump after clearing the cache so a session that sees the new
+        # version cannot read the old file back out of it
+        version = next(_TRACKER_WRITES)
+        _TRACKER_VERSIONS[tracker_type] = version
+        ss.setdefault("tracker_versions", {})[tracker_type] = version
 
 
 def convert_excel(df):
@@ -589,13 +779,15 @@ def archive_findings():
     Returns:
         None
     """
-    curd = date.today()
-    s3_c_df = ingest_tracker(tracker_type="complete", s3=True)
-    for index, row in s3_c_df.iterrows():
-        if s3_c_df.loc[index, "DateOfSavings"] is not None:
-            if s3_c_df.loc[index, "DateOfSavings"] < (curd - relativedelta(years=+2)):
-                st.write(f"Dropping row {row}")
-                s3_c_df = s3_c_df.drop(index)
+    cutoff = pd.Timestamp(date.today() - relativedelta(years=+2))
+    s3_c_df = ingest_tracker(tracker_type="complete", s3=True, fresh=True)
+    expired = pd.to_datetime(s3_c_df["DateOfSavings"]) < cutoff
+    # Only upload when something was archived
+    if not expired.any():
+        return
+    st.write("Dropping rows:")
+    st.write(s3_c_df[expired])
+    s3_c_df = s3_c_df[~expired]
     write_tracker(s3_c_df, tracker_type="complete", s3=True)
 
 
@@ -617,13 +809,21 @@ def add_to_tracker(df, s_file=None, state=None):
     if "tracker_df" not in ss:
         ss.tracker_df = ingest_tracker(s3=True)
     if state is not None and s_file is not None:
-        for index in ss[state]["edited_rows"].keys():
-            if ss[state]["edited_rows"][index]["MoveToTracker"]:
-                ss.tracker_df.loc[len(ss.tracker_df)] = df.loc[index]
-                df.drop(index, inplace=True)
+        selected = [
+            index
+            for index, edits in ss[state]["edited_rows"].items()
+            if edits["MoveToTracker"]
+        ]
+        # Append every selected row in one concat rather than growing the
+        # tracker a row at a time
+        ss.tracker_df = pd.concat(
+            [ss.tracker_df, df.loc[selected].reindex(columns=ss.tracker_df.columns)],
+            ignore_index=True,
+        )
+        df.drop(selected, inplace=True)
         if s_file is not None:
             df = df.reset_index(drop=True)
-            df.to_parquet(s_file)
+            df.to_feather(s_file, compression="uncompressed")
     else:
         st.markdown(
             ":red[Unexpected Condition, items were NOT added to tracker]")
@@ -644,11 +844,11 @@ def add_self_identified_to_tracker():
     """
     if "tracker_df" not in ss:
         ss.tracker_df = ingest_tracker(s3=True)
-    for row in ss[ss.dek]["added_rows"]:
-        next_index = len(ss.tracker_df)
-        for key in row.keys():
-            ss.tracker_df.loc[next_index, key] = row[key]
-        st.write(ss.tracker_df.loc[next_index])
+    added_rows = ss[ss.dek]["added_rows"]
+    if added_rows:
+        added_df = pd.DataFrame(added_rows)
+        ss.tracker_df = pd.concat([ss.tracker_df, added_df], ignore_index=True)
+        st.write(added_df)
     write_tracker(ss.tracker_df, s3=True)
     ss.dek = str(uuid.uuid4())
 
@@ -667,19 +867,24 @@ def tagmapper(items):
         Relevant tags include: 'Name', 'Cost Center', 'Service Group', 'Optimization Exemption'
     """
 
-    relevant_tags = ["Name", "Cost Center",
-                     "Service Group", "Optimization Exemption"]
+    relevant_tags = {"Name", "Cost Center",
+                     "Service Group", "Optimization Exemption"}
+    # Every caller passes items from a single API, so the tag key casing
+    # ("Key"/"Value" from EC2, "key"/"value" from Cost Optimization Hub)
+    # is the same for all of them; detect it from the first tagged item
+    first_tags = next((item["tags"] for item in items if item["tags"]), None)
+    if first_tags is None:
+        return items
+    if first_tags[0].get("Key") is not None:
+        key = "Key"
+        val = "Value"
+    else:
+        key = "key"
+        val = "value"
     for item in items:
-        if len(item["tags"]) > 0:
-            if item["tags"][0].get("Key") is not None:
-                key = "Key"
-                val = "Value"
-            else:
-                key = "key"
-                val = "value"
-            for tag in item["tags"]:
-                if tag[key] in relevant_tags:
-                    item[tag[key]] = tag[val]
+        item.update(
+            {tag[key]: tag[val] for tag in item["tags"] if tag[key] in relevant_tags}
+        )
     return items
 
 
@@ -737,6 +942,67 @@ def calcost_ebs(vtype, iops, throughput, size):
     return cost
 
 
+def calcost_ebs_vec(vtype, iops, throughput, size):
+    """
+    Calculates the cost of many EBS volumes at once, with the same pricing as calcost_ebs.
+
+    Args:
+        vtype (array-like): Volume types ('gp2', 'gp3', 'st1', 'sc1', 'io1', 'io2', 'standard')
+        iops (array-like): IOPS values, None where the volume type has none
+        throughput (array-like): Throughput values in MB/s, None where not set
+        size (array-like): Sizes of the volumes in GB
+
+    Returns:
+        numpy.ndarray: Monthly cost of each EBS volume in USD
+
+    Raises:
+        ValueError: If any size is not positive
+    """
+
+    vtype = np.asarray(vtype, dtype=object)
+    iops = np.nan_to_num(np.asarray(iops, dtype=float))
+    throughput = np.nan_to_num(np.asarray(throughput, dtype=float))
+    size = np.asarray(size, dtype=float)
+    if (size <= 0).any():
+        raise ValueError("Size must be a positive integer.")
+
+    # io2 IOPS are billed in tiers of 32,000
+    io2_iops = np.select(
+        [iops > 64000, iops > 32000],
+        [
+            (32000 * 0.065) + (32000 * 0.046) + ((iops - 64000) * 0.032),
+            (32000 * 0.065) + ((iops - 32000) * 0.046),
+        ],
+        default=iops * 0.065,
+    )
+    gp3 = (
+        0.08 * size
+        + np.where(iops > 3000, (iops - 3000) * 0.005, 0)
+        + np.where(throughput > 125, (throughput - 125) * 0.04, 0)
+    )
+    return np.select(
+        [
+            vtype == "gp2",
+            vtype == "gp3",
+            vtype == "st1",
+            vtype == "sc1",
+            vtype == "io1",
+            vtype == "io2",
+            vtype == "standard",
+        ],
+        [
+            0.10 * size,
+            gp3,
+            0.045 * size,
+            0.015 * size,
+            (0.125 * size) + (0.065 * iops),
+            (0.125 * size) + io2_iops,
+            0.05 * size,
+        ],
+        default=1000000,
+    )
+
+
 def find_unattached_ebs():
     """
     Iterates across all known AWS accounts looking for EBS volumes that are not attached.
@@ -745,136 +1011,176 @@ def find_unattached_ebs():
         List of dictionaries containing information about unattached EBS volumes
             with estimated monthly savings and other relevant details
 
+    Note:
+        Accounts are scanned concurrently on a thread pool
     """
-    volumes = []
     ANAMES = get_account_names()
-    for account in ANAMES:
-        session = boto3.Session(profile_name=account)
-        ec2_client = session.client("ec2", "us-east-1")
-        paginator = ec2_client.get_paginator("describe_volumes")
-        rit = paginator.paginate(
-            Filters=[{"Name": "status", "Values": ["available"]}])
-
-        for page in rit:
-            for volume in page["Volumes"]:
-                vol = {}
-                cost = calcost_ebs(
-                    volume["VolumeType"],
-                    volume.get("Iops"),
-                    volume.get("Throughput"),
-                    volume["Size"],
-                )
-                vol["resourceId"] = volume["VolumeId"]
-                vol["Account"] = account
-                vol["estimatedMonthlySavings"] = cost
-                vol["actionType"] = "Unattached EBS"
-                vol["Type"] = volume["VolumeType"]
-                vol["Size"] = volume["Size"]
-                vol["IOPS"] = volume.get("Iops")
-                vol["Throughput"] = volume.get("Throughput")
-                if volume.get("Tags") is not None:
-                    vol["tags"] = volume["Tags"]
-                else:
-                    vol["tags"] = []
-                vol["RecommendationId"] = recid_hasher(
-                    vol["Account"], vol["resourceId"], vol["estimatedMonthlySavings"]
-                )
-                volumes.append(vol.copy())
+    clients = [_client(account, "ec2") for account in ANAMES]
+    with ThreadPoolExecutor(max_workers=MAX_ACCOUNT_WORKERS) as executor:
+        results = list(executor.map(_scan_account_ebs, ANAMES, clients))
+    volumes = list(itertools.chain.from_iterable(results))
     volumes = tagmapper(volumes)
 
     return volumes
 
 
+def _scan_account_ebs(account, ec2_client):
+    """Collect the unattached EBS volumes of a single account"""
+    volumes = []
+    paginator = ec2_client.get_paginator("describe_volumes")
+    rit = paginator.paginate(
+        Filters=[{"Name": "status", "Values": ["available"]}])
+
+    for page in rit:
+        if not page["Volumes"]:
+            continue
+        # Price the whole page in one pass rather than volume by volume
+        costs = calcost_ebs_vec(
+            [volume["VolumeType"] for volume in page["Volumes"]],
+            [volume.get("Iops") for volume in page["Volumes"]],
+            [volume.get("Throughput") for volume in page["Volumes"]],
+            [volume["Size"] for volume in page["Volumes"]],
+        ).tolist()
+        for volume, cost in zip(page["Volumes"], costs):
+            vol = {}
+            vol["resourceId"] = volume["VolumeId"]
+            vol["Account"] = account
+            vol["estimatedMonthlySavings"] = cost
+            vol["actionType"] = "Unattached EBS"
+            vol["Type"] = volume["VolumeType"]
+            vol["Size"] = volume["Size"]
+            vol["IOPS"] = volume.get("Iops")
+            vol["Throughput"] = volume.get("Throughput")
+            if volume.get("Tags") is not None:
+                vol["tags"] = volume["Tags"]
+            else:
+                vol["tags"] = []
+            vol["RecommendationId"] = recid_hasher(
+                vol["Account"], vol["resourceId"], vol["estimatedMonthlySavings"]
+            )
+            volumes.append(vol)
+    return volumes
+
+
 def recid_hasher(value1, value2, value3):
     """
     Take a recommendation that does not have an ID and generate
     a recommendation ID based on a hash of critical values for that
     item
+
+    The ID is only a dedupe key, so a fast non-cryptographic 128-bit
+    hash (xxh3) is used. Values are separated by a unit separator byte
+    so ("a", "bc") and ("ab", "c") do not hash the same
     """
-    hashme = str(value1) + str(value2) + str(value3)
-    return hashlib.sha256(hashme.encode("utf-8")).hexdigest()
+    hasher = xxhash.xxh3_128()
+    for value in (value1, value2, value3):
+        if not isinstance(value, str):
+            value = str(value)
+        hasher.update(value.encode("utf-8"))
+        hasher.update(b"\x1f")
+    return hasher.hexdigest()
 
 
 def find_stopped_ec2():
     """Locate EC2 instances that are stopped and identify their EBS cost"""
     instances = []
     ANAMES = get_account_names()
-    for account in ANAMES:
-        session = boto3.Session(profile_name=account)
-        ec2_client = session.client("ec2", "us-east-1")
-        paginator = ec2_client.get_paginator("describe_instances")
-        rit = paginator.paginate(
-            Filters=[{"Name": "instance-state-name", "Values": ["stopped"]}]
-        )
-
-        for page in rit:
+    clients = [_client(account, "ec2") for account in ANAMES]
+    # Accounts are scanned on worker threads; Streamlit output has to stay on
+    # the script thread, so progress is reported here as each account returns
+    with ThreadPoolExecutor(max_workers=MAX_ACCOUNT_WORKERS) as executor:
+        for account, (reservations, found) in zip(
+            ANAMES, executor.map(_scan_account_ec2, ANAMES, clients)
+        ):
             st.write(
                 "Found "
-                + str(len(page["Reservations"]))
+                + str(reservations)
                 + " Reservations to calculate for EC2 Savings in "
                 + str(account)
             )
-            for reservation in page["Reservations"]:
-                for instance in reservation["Instances"]:
-                    inst = {}
-                    cost = 0
-                    inst["resourceId"] = instance["InstanceId"]
-                    inst["Account"] = account
-                    inst["state"] = instance["State"]
-                    inst["type"] = instance["InstanceType"]
-                    inst["platform"] = instance.get("Platform")
-                    inst["volumes"] = []
-                    inst["actionType"] = "Stopped EC2 Instance"
-                    for dev in instance["BlockDeviceMappings"]:
-                        vid = dev["Ebs"]["VolumeId"]
-                        inst["volumes"].append(vid)
-                        r = ec2_client.describe_volumes(VolumeIds=[vid])
-                        volume = r["Volumes"][0]
-                        cost += calcost_ebs(
-                            volume["VolumeType"],
-                            volume.get("Iops"),
-                            volume.get("Throughput"),
-                            volume["Size"],
-                        )
-                    inst["estimatedMonthlySavings"] = cost
-                    if instance.get("Tags") is None:
-                        inst["tags"] = []
-                    else:
-                        inst["tags"] = instance["Tags"]
-                    inst["RecommendationId"] = recid_hasher(
-                        inst["Account"],
-                        inst["resourceId"],
-                        inst["estimatedMonthlySavings"],
-                    )
-                    instances.append(inst.copy())
+            instances.extend(found)
 
     instances = tagmapper(instances)
     return instances
 
 
+def _scan_account_ec2(account, ec2_client):
+    """
+    Collect the stopped EC2 instances of a single account
+
+    Returns:
+        tuple: Number of reservations seen, and the list of instance findings
+    """
+    reservations = 0
+    instances = []
+    paginator = ec2_client.get_paginator("describe_instances")
+    rit = paginator.paginate(
+        Filters=[{"Name": "instance-state-name", "Values": ["stopped"]}]
+    )
+
+    for page in rit:
+        reservations += len(page["Reservations"])
+        # Resolve every attached volume on the page up front rather than
+        # one describe_volumes call per block device
+        vids = [
+            dev["Ebs"]["VolumeId"]
+            for reservation in page["Reservations"]
+            for instance in reservation["Instances"]
+            for dev in instance["BlockDeviceMappings"]
+        ]
+        page_volumes = {}
+        for i in range(0, len(vids), DESCRIBE_VOLUMES_BATCH):
+            r = ec2_client.describe_volumes(
+                VolumeIds=vids[i: i + DESCRIBE_VOLUMES_BATCH]
+            )
+            for volume in r["Volumes"]:
+                page_volumes[volume["VolumeId"]] = volume
+        for reservation in page["Reservations"]:
+            for instance in reservation["Instances"]:
+                inst = {}
+                cost = 0
+                inst["resourceId"] = instance["InstanceId"]
+                inst["Account"] = account
+                inst["state"] = instance["State"]
+                inst["type"] = instance["InstanceType"]
+                inst["platform"] = instance.get("Platform")
+                inst["volumes"] = []
+                inst["actionType"] = "Stopped EC2 Instance"
+                for dev in instance["BlockDeviceMappings"]:
+                    vid = dev["Ebs"]["VolumeId"]
+                    inst["volumes"].append(vid)
+                    volume = page_volumes[vid]
+                    cost += calcost_ebs(
+                        volume["VolumeType"],
+                        volume.get("Iops"),
+                        volume.get("Throughput"),
+                        volume["Size"],
+                    )
+                inst["estimatedMonthlySavings"] = cost
+                if instance.get("Tags") is None:
+                    inst["tags"] = []
+                else:
+                    inst["tags"] = instance["Tags"]
+                inst["RecommendationId"] = recid_hasher(
+                    inst["Account"],
+                    inst["resourceId"],
+                    inst["estimatedMonthlySavings"],
+                )
+                instances.append(inst)
+    return reservations, instances
+
+
 def aggregate_summary_parallel(findings, status_import, status_file=None):
     """
     Create an aggregate view that removes the details and creates common
     elements to enable status tracking.  This view will also be what is
     consumed to persist status tracking
     """
-    aggregation = []
-
-    # Split the recommendations list into chunks of 250
-    chunk_size = 250
-    findings_chunks = [
-        findings[i: i + chunk_size] for i in range(0, len(findings), chunk_size)
-    ]
-    print("Chunking/Parsing CHub Recommendations and sanitizing")
-    # Create a pool of worker processes
-    with multiprocessing.Pool() as pool:
-        # Process each chunk in parallel
-        results = pool.map(
-            parse_findings_chunk, [([], chunk) for chunk in findings_chunks]
-        )
-
-        # Combine the results from all chunks
-        aggregation = [item for result in results for item in result]
+    print("Parsing CHub Recommendations and sanitizing")
+    # parse_findings works on whole columns, so one call over every finding
+    # is cheaper than fanning chunks out to workers, and instance type
+    # specs are looked up once for the full set
+    aggregation = parse_findings([], findings)
 
     print("Importing status from Tracker File " + status_file)
     if status_import:
@@ -883,6 +1189,26 @@ def aggregate_summary_parallel(findings, status_import, status_file=None):
     return aggregation
 
 
+def summary_frame(aggregation):
+    """
+    Builds the summary DataFrame from aggregate_summary_parallel records.
+
+    Args:
+        aggregation (list): Summary finding dicts produced by parse_findings
+
+    Returns:
+        pandas.DataFrame: One row per finding with the SUMMARY_SCHEMA columns
+
+    Note:
+        The records are converted by Arrow in a single pass against a fixed
+        schema instead of pandas inferring each column from the dicts. The
+        detailed findings differ in keys from record to record, so they are
+        still built with pd.DataFrame
+    """
+    table = pa.Table.from_pylist(aggregation, schema=SUMMARY_SCHEMA)
+    return table.to_pandas(self_destruct=True)
+
+
 def import_status(aggregation):
     """Function is designed to parse a Cost Tracker file, and find in-progress or
     exempt findings, and load their status"""
@@ -896,33 +1222,40 @@ def import_status(aggregation):
     merged_df = pd.concat([ss.tracker_df, ss.extracker_df], ignore_index=True)
 
     print("Comparing Source File to Generated Output")
-    for index, row in merged_df.iterrows():
-        if merged_df.loc[index, "ResourceId"] is not None:
-            if merged_df.loc[index, "FinOpsStatus"] is None:
-                merged_df.loc[index, "FinOpsStatus"] = "Needs Research"
-            status = merged_df.loc[index, "FinOpsStatus"]
-            if status.lower() not in [
-                "needs research",
-                "complete",
-                "completed",
-                "archived",
-                "archive",
-            ]:
-                resid = merged_df.loc[index, "ResourceId"]
-                stype = merged_df.loc[index, "Savings Type"]
-                for agg in aggregation:
-                    if agg["ResourceId"] == resid and agg["Savings Type"] == stype:
-                        agg["FinOpsStatus"] = status
+    merged_df["FinOpsStatus"] = merged_df["FinOpsStatus"].fillna("Needs Research")
+
+    # Index the findings by (ResourceId, Savings Type) once so each tracker
+    # row is matched with a dict lookup instead of a scan of every finding
+    agg_index = {}
+    for agg in aggregation:
+        agg_index.setdefault((agg["ResourceId"], agg["Savings Type"]), []).append(agg)
+
+    # Only rows with a resource and a non-terminal status carry a status over
+    lowered = merged_df["FinOpsStatus"].str.lower()
+    active = merged_df["ResourceId"].notna() & ~lowered.isin(TERMINAL_STATUSES)
+    rows = merged_df.loc[
+        active, ["ResourceId", "FinOpsStatus", "Savings Type"]
+    ].itertuples(index=False, name=None)
+    for resid, status, stype in rows:
+        for agg in agg_index.get((resid, stype), ()):
+            agg["FinOpsStatus"] = status
     return aggregation
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _read_pair(sfile, dfile, sfile_mtime, dfile_mtime):
+    # The mtimes are only part of the cache key, so rewriting either file
+    # misses the cache and the new contents are read
+    return pd.read_feather(sfile), pd.read_feather(dfile)
+
+
 def get_finding(sfile, dfile, func, force_update=False):
     """
     Retrieves or generates finding data based on file freshness and force update flag.
 
     Args:
-        sfile (str): Path to the summary parquet file
-        dfile (str): Path to the detailed parquet file
+        sfile (str): Path to the summary Arrow IPC (Feather) file
+        dfile (str): Path to the detailed Arrow IPC (Feather) file
         func (str): Function identifier to use for data generation ('chub', 'sec2', or 'uebs')
         force_update (bool, optional): Force regeneration of data from AWS. Defaults to False.
 
@@ -942,8 +1275,9 @@ def get_finding(sfile, dfile, func, force_update=False):
         and file_modified_recently(dfile)
         and not force_update
     ):
-        summary_df = pd.read_parquet(sfile)
-        detailed_df = pd.read_parquet(dfile)
+        summary_df, detailed_df = _read_pair(
+            sfile, dfile, os.stat(sfile).st_mtime, os.stat(dfile).st_mtime
+        )
     else:
         st.write("## Findings are Stale need to regenerate them from AWS")
         if check_token_time() == "":
@@ -957,8 +1291,10 @@ def get_finding(sfile, dfile, func, force_update=False):
             )
             st.stop()
         summary_df, detailed_df = switcher[func]()
-        summary_df.to_parquet(sfile)
-        detailed_df.to_parquet(dfile)
+        # Local scratch files only, so skip parquet encoding and compression
+        summary_df.to_feather(sfile, compression="uncompressed")
+        detailed_df.to_feather(dfile, compression="uncompressed")
+        file_modified_recently.cache_clear()
 
     return summary_df, detailed_df
 
@@ -974,7 +1310,7 @@ def gen_uebs():
     """
     uebs = find_unattached_ebs()
     detailed_df = pd.DataFrame(uebs)
-    summary_df = pd.DataFrame(
+    summary_df = summary_frame(
         aggregate_summary_parallel(uebs, STATUS_IMPORT, TRACKER_FILE)
     )
 
@@ -993,7 +1329,7 @@ def gen_sec2():
 
     stopped_ec2s = find_stopped_ec2()
     detailed_df = pd.DataFrame(stopped_ec2s)
-    summary_df = pd.DataFrame(
+    summary_df = summary_frame(
         aggregate_summary_parallel(stopped_ec2s, STATUS_IMPORT, TRACKER_FILE)
     )
 
@@ -1018,29 +1354,34 @@ def gen_chub():
     request_filter = {
         "implementationEfforts": ["VeryLow", "Low", "Medium"],
     }
-    session = boto3.Session(profile_name=ACCOUNT)
-    chub_client = session.client("cost-optimization-hub", "us-east-1")
+    chub_client = _client(ACCOUNT, "cost-optimization-hub")
     paginator = chub_client.get_paginator("list_recommendations")
-    recommendations = []
-    pruned_recommendations = []
+    # Map account IDs to names with one dict instead of scanning the
+    # account list for every recommendation
+    acct_map = {
+        account["accountId"]: aname_sanitizer(account["accountName"])
+        for account in get_accounts()
+    }
 
+    # Prune and map each page as it arrives; botocore hands back fresh
+    # dicts that nothing else holds, so they are updated in place
+    pruned_recommendations = []
     for page in paginator.paginate(filter=request_filter):
-        recommendations.extend(page["items"])
-    accounts = get_accounts()
-    for recommendation in recommendations:
-        if recommendation.get("currentResourceType") != "RdsReservedInstances":
+        for recommendation in page["items"]:
+            if recommendation.get("currentResourceType") == "RdsReservedInstances":
+                continue
             recommendation["RecommendationId"] = recommendation["recommendationId"]
-            recommendation["accountId"] = map_accountid_to_name(
-                accounts, recommendation["accountId"]
+            recommendation["accountId"] = acct_map.get(
+                recommendation["accountId"], recommendation["accountId"]
             )
-            pruned_recommendations.append(recommendation.copy())
+            pruned_recommendations.append(recommendation)
 
     st.write("Generating Cost Optimization Hub Findings")
     pruned_recommendations = tagmapper(pruned_recommendations)
     st.write("Number of Cost Hub Findings: " +
              str(len(pruned_recommendations)))
 
-    summary_df = pd.DataFrame(
+    summary_df = summary_frame(
         aggregate_summary_parallel(
             pruned_recommendations, STATUS_IMPORT, TRACKER_FILE)
     )
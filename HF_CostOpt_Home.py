@@ -3,12 +3,12 @@ from SSOGetCredentials import sso_login
 import CostOptimizationDataPull as codp
 
 
-CHUB_SUMMARY_FILE = "/tmp/chub_sum.parquet"
-CHUB_DETAILED_FILE = "/tmp/chub_det.parquet"
-SEC2_SUMMARY_FILE = "/tmp/sec2_sum.parquet"
-SEC2_DETAILED_FILE = "/tmp/sec2_det.parquet"
-UEBS_SUMMARY_FILE = "/tmp/uebs_sum.parquet"
-UEBS_DETAILED_FILE = "/tmp/uebs_det.parquet"
+CHUB_SUMMARY_FILE = "/tmp/chub_sum.arrow"
+CHUB_DETAILED_FILE = "/tmp/chub_det.arrow"
+SEC2_SUMMARY_FILE = "/tmp/sec2_sum.arrow"
+SEC2_DETAILED_FILE = "/tmp/sec2_det.arrow"
+UEBS_SUMMARY_FILE = "/tmp/uebs_sum.arrow"
+UEBS_DETAILED_FILE = "/tmp/uebs_det.arrow"
 
 
 st.set_page_config(page_title="Cost Management Working Portal", layout="wide")
@@ -29,18 +29,9 @@ st.write(codp.S3_TRACKER_INPROGRESS)
 st.markdown("## Active SSO Session Established")
 
 st.markdown("## Loading Tracker File")
-if "tracker_df" not in st.session_state:
-    st.session_state.tracker_df = codp.ingest_tracker(
-        tracker_type="inprogress", s3=True
-    )
-
-if "ctracker_df" not in st.session_state:
-    st.session_state.ctracker_df = codp.ingest_tracker(
-        tracker_type="complete", s3=True)
-
-if "extracker_df" not in st.session_state:
-    st.session_state.ctracker_df = codp.ingest_tracker(
-        tracker_type="exempt", s3=True)
+codp.load_session_tracker("inprogress")
+codp.load_session_tracker("complete")
+codp.load_session_tracker("exempt")
 
 chub_button = st.button(
     "Load Cost Optimization Hub Findings",
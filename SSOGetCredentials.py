@@ -17,6 +17,8 @@ import os
 from datetime import datetime, timedelta
 from time import sleep
 import configparser
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 import pytz
 import boto3
@@ -24,33 +26,62 @@ import streamlit as st
 
 START_URL = 'https://d-90670a4e60.awsapps.com/start'
 SSO_DIR = os.path.expanduser('~/.aws/sso/cache')
-CACHE = hashlib.sha1(START_URL.encode("utf-8")).hexdigest()
+# botocore and the AWS CLI look for the SSO token at sha1(start URL).json,
+# so the name must stay SHA-1; it is a file name, not a security hash
+CACHE = hashlib.sha1(START_URL.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 PATH = f'{SSO_DIR}/{CACHE}.json'
+ROLE_LOOKUP_WORKERS = 16
 
-def check_token_time(now=datetime.now(pytz.UTC), data={}):
-    
+# Parsed token file, reused until the file changes or the token expires
+_TOKEN_CACHE = {'mtime': None, 'token': '', 'expires': None}
+
+@functools.lru_cache(maxsize=None)
+def _sso_client(service):
+    '''
+    Return the us-east-1 client for an SSO service, built once per process'''
+    return boto3.client(service, 'us-east-1')
+
+_DIR_READY = False
+
+def _ensure_sso_dir():
+    '''
+    Create the SSO cache directory once per process'''
+    global _DIR_READY
+    if not _DIR_READY:
+        os.makedirs(SSO_DIR, exist_ok=True)
+        _DIR_READY = True
+
+def check_token_time():
+    '''
+    Return the cached SSO access token, or an empty string if it is missing or expired'''
 #    json_files = [pos_json for pos_json in os.listdir(SSO_DIR) if pos_json.endswith('.json')]
 #    if len(json_files) > 0:
 #        for json_file in json_files :
-    os.makedirs(SSO_DIR, exist_ok=True) 
     now = datetime.now(pytz.UTC)  
     accesstoken = ''
-    if not os.path.isfile(PATH):
-        data['startUrl'] = "https://d-90670a4e60.awsapps.com/start"
-        data['region'] = "us-east-1"
-        data['accessToken'] = accesstoken
-        data['expiresAt'] = ''
-        data['clientId'] = ''
-        data['clientSecret'] = ''
-        data['registrationExpiresAt'] = ''
-    else:
-        with open(PATH, 'r', encoding='utf-8') as file :
-            data = json.load(file)
-            if data.get('expiresAt') is not None:
-                dt = datetime.fromisoformat(data['expiresAt'])
-                if  now < dt:
-                    accesstoken = data['accessToken'] 
+    try:
+        file = open(PATH, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        # No token yet; make sure get_access_token can write one
+        _ensure_sso_dir()
+        return accesstoken
+    with file:
+        mtime = os.fstat(file.fileno()).st_mtime_ns
+        if (
+            mtime == _TOKEN_CACHE['mtime']
+            and _TOKEN_CACHE['expires'] is not None
+            and now < _TOKEN_CACHE['expires']
+        ):
+            return _TOKEN_CACHE['token']
+        data = json.load(file)
+        if data.get('expiresAt') is not None:
+            dt = datetime.fromisoformat(data['expiresAt'])
+            if  now < dt:
+                accesstoken = data['accessToken'] 
+                _TOKEN_CACHE['mtime'] = mtime
+                _TOKEN_CACHE['token'] = accesstoken
+                _TOKEN_CACHE['expires'] = dt
 
     return accesstoken
 
@@ -62,10 +93,11 @@ def get_access_token(webui=False):
     '''
     host = socket.gethostname()
     now = datetime.now(pytz.UTC)
-    data = {}
-    accesstoken = check_token_time(now, data)
+    accesstoken = check_token_time()
     if accesstoken == '':
-        sso_oidc = boto3.client('sso-oidc', 'us-east-1')
+        # Everything the token cache file needs besides what the flow below fills in
+        data = {'startUrl': START_URL, 'region': 'us-east-1'}
+        sso_oidc = _sso_client('sso-oidc')
         client_creds = sso_oidc.register_client(
             clientName=host,
             clientType='public',
@@ -123,14 +155,28 @@ def update_config_files(accesstoken):
 
     config = configparser.RawConfigParser()
     config.read(config_file)
-    client = boto3.client('sso', 'us-east-1')
+    client = _sso_client('sso')
 
     account_list = get_accounts(accesstoken)
-    for account in account_list:
-        r2 = client.list_account_roles(
-            accessToken=accesstoken,
-            accountId=account['accountId']
-        )
+    # Roles are only needed for accounts without a profile yet; fetch them
+    # concurrently since each call is an independent SSO round trip
+    new_accounts = [
+        account for account in account_list
+        if not config.has_section('profile ' + aname_sanitizer(account['accountName']))
+    ]
+    with ThreadPoolExecutor(max_workers=ROLE_LOOKUP_WORKERS) as executor:
+        role_lists = dict(zip(
+            [account['accountId'] for account in new_accounts],
+            executor.map(
+                lambda account: client.list_account_roles(
+                    accessToken=accesstoken,
+                    accountId=account['accountId']
+                ),
+                new_accounts,
+            ),
+        ))
+    for account in new_accounts:
+        r2 = role_lists[account['accountId']]
         configpath = 'profile ' + aname_sanitizer(account['accountName'])
         if not config.has_section(configpath):
             config.add_section(configpath)
@@ -165,8 +211,16 @@ def get_accounts(accesstoken=None):
     '''
     if accesstoken is None:
         accesstoken = get_access_token()
+    return _list_accounts(accesstoken)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _list_accounts(accesstoken):
+    '''
+    Page through list_accounts for an access token
+    Cached for an hour per token, so a new login fetches the list again
+    '''
     # Create the client
-    client = boto3.client('sso', 'us-east-1')
+    client = _sso_client('sso')
 
     # Get the paginator for the list_accounts operation
     paginator = client.get_paginator('list_accounts')
@@ -211,8 +265,6 @@ def map_accountid_to_name(accounts, accountid):
             return aname_sanitizer(account['accountName'])
     return(accountid)
 
-#Look at way to preserve in memory the account listing to avoid repeated API calls
-
 def sso_login(webui=False):
 
     '''
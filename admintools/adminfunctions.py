@@ -38,44 +38,22 @@ def split_exempt():
     """
 
     tracker_df = codp.ingest_tracker(
-            tracker_type="inprogress", s3=True
+            tracker_type="inprogress", s3=True, fresh=True
         )
 
     ctracker_df = codp.ingest_tracker(
-            tracker_type="complete", s3=True)
+            tracker_type="complete", s3=True, fresh=True)
         
-    exdf = pd.DataFrame(
-        columns=[
-            "ResourceId",
-            "RecommendationId",
-            "DateOfSavings",
-            "FinOpsStatus",
-            "FinOpsLastModified",
-            "Comments",
-            "Account",
-            "estimatedMonthlySavings",
-            "Savings Type",
-            "Cost Center",
-            "Service Group",
-            "Optimization Exemption",
-            "Resource ID + Type",
-        ]
-    )
+    exempt = tracker_df["FinOpsStatus"].str.lower().eq("exempt")
+    cexempt = ctracker_df["FinOpsStatus"].str.lower().eq("exempt")
 
-    exdf = exdf.astype(DF_TYPE_DICT)
+    exdf = pd.concat(
+        [tracker_df[exempt], ctracker_df[cexempt]], ignore_index=True
+    )
+    exdf = exdf.reindex(columns=list(DF_TYPE_DICT)).astype(DF_TYPE_DICT)
 
-    for index, row in tracker_df.iterrows():
-        if (
-            tracker_df.loc[index, "FinOpsStatus"].lower() == "exempt"
-        ):
-            exdf.loc[len(exdf)] = tracker_df.loc[index].copy()
-            tracker_df = tracker_df.drop([index])
-    for index, row in ctracker_df.iterrows():
-        if (
-            ctracker_df.loc[index, "FinOpsStatus"].lower() == "exempt"
-        ):
-            exdf.loc[len(exdf)] = ctracker_df.loc[index].copy()
-            ctracker_df = ctracker_df.drop([index])
+    tracker_df = tracker_df[~exempt]
+    ctracker_df = ctracker_df[~cexempt]
 
     codp.write_tracker(tracker_df, tracker_type="inprogress")
     codp.write_tracker(ctracker_df, tracker_type="complete")
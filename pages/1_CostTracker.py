@@ -16,24 +16,19 @@ through streamlit's session state functionality.
 import pandas as pd
 import streamlit as st
 from streamlit import session_state as ss
-from datetime import date
 import CostOptimizationDataPull as codp
 import uuid
 
-COL_CONFIG = {
-    "DateOfSavings": st.column_config.DateColumn(
-        "DateOfSavings", min_value=date(2022, 1, 1), format="MM-DD-YYYY", step=1
-    ),
-    "FinOpsLastModified": st.column_config.DateColumn(
-        "FinOpsLastModified", min_value=date(2022, 1, 1), format="MM-DD-YYYY", step=1
-    ),
-}
-
 st.set_page_config(page_title="Active Findings Cost Tracker", layout="wide")
 
 if "unwritten_indexes" not in ss:
     ss.unwritten_indexes = []
 
+# Keys of the sidebar filter checkboxes, so clear_filter does not have to
+# scan all of session state
+if "tracker_filter_keys" not in ss:
+    ss.tracker_filter_keys = set()
+
 blank_df = pd.DataFrame(
     columns=[
         "ResourceId",
@@ -72,15 +67,16 @@ blank_df = blank_df.astype(df_type_dict)
 
 
 def clear_filter():
-    for key, value in ss.items():
-        if "filter_" in key and not value:
+    for key in ss.tracker_filter_keys:
+        if not ss[key]:
             ss[key] = True
 
 
 st.markdown("# Active Findings Cost Tracker")
 st.sidebar.header("Active Findings Cost Tracker")
 
-ss.tracker_df = codp.ingest_tracker(tracker_type="inprogress", s3=True)
+# Reuse the session copy across reruns until any session saves the tracker
+codp.load_session_tracker("inprogress")
 
 if "DateOfSavings" not in ss.tracker_df.columns:
     st.write("Initializing Date of Savings Row")
@@ -88,9 +84,12 @@ if "DateOfSavings" not in ss.tracker_df.columns:
     ss.tracker_df = codp.build_savings_date_column(ss.tracker_df)
 
 if len(ss.unwritten_indexes) > 0:
-    unwritten_df = blank_df.copy()
-    for index in ss.unwritten_indexes:
-        unwritten_df.loc[len(unwritten_df)] = ss.tracker_df.loc[index]
+    unwritten_df = (
+        ss.tracker_df.loc[list(ss.unwritten_indexes)]
+        .reindex(columns=blank_df.columns)
+        .astype(df_type_dict)
+        .reset_index(drop=True)
+    )
     st.markdown(":red[Elements failed to write to S3.  S3 has newer records]")
     st.write(unwritten_df)
 
@@ -99,7 +98,7 @@ with st.form("Tracker_Form"):
         ss.tracker_df,
         num_rows="fixed",
         hide_index=False,
-        column_config=COL_CONFIG,
+        column_config=codp.TRACKER_COL_CONFIG,
         key="ietracker",
     )
     ss.unwritten_undexes = st.form_submit_button(
@@ -116,7 +115,7 @@ with st.form("Row_Add_Form"):
         blank_df,
         num_rows="dynamic",
         hide_index=True,
-        column_config=COL_CONFIG,
+        column_config=codp.TRACKER_COL_CONFIG,
         key=ss.dek,
     )
     st.form_submit_button("Save", on_click=codp.add_self_identified_to_tracker)
@@ -144,23 +143,17 @@ def filter_process():
     st.write(statuses)
     for item in statuses:
         boxkey = "filter_status_" + item
+        ss.tracker_filter_keys.add(boxkey)
         st.sidebar.checkbox(item, key=boxkey, value=True)
 
     st.sidebar.markdown("Savings Type Filter")
     for item in stypes:
         boxkey = "filter_stype_" + item
+        ss.tracker_filter_keys.add(boxkey)
         st.sidebar.checkbox(item, key=boxkey, value=True)
 
-    checked_statuses = []
-    checked_stypes = []
-
-    for box in statuses:
-        if ss["filter_status_" + box]:
-            checked_statuses.append(box)
-
-    for box in stypes:
-        if ss["filter_stype_" + box]:
-            checked_stypes.append(box)
+    checked_statuses = [box for box in statuses if ss["filter_status_" + box]]
+    checked_stypes = [box for box in stypes if ss["filter_stype_" + box]]
 
     ss.tracker_df = ss.tracker_df[
         ss.tracker_df["FinOpsStatus"].isin(checked_statuses)
@@ -1,9 +1,8 @@
-import pandas as pd
 import streamlit as st
 import CostOptimizationDataPull as codp
 
-CHUB_SUMMARY_FILE = "/tmp/chub_sum.parquet"
-CHUB_DETAILED_FILE = "/tmp/chub_det.parquet"
+CHUB_SUMMARY_FILE = "/tmp/chub_sum.arrow"
+CHUB_DETAILED_FILE = "/tmp/chub_det.arrow"
 
 st.set_page_config(page_title="Cost Hub Findings", layout="wide")
 st.markdown("# Cost Hub Findings")
@@ -12,7 +11,7 @@ st.sidebar.header("Cost Hub Findings")
 summary_df, detailed_df = codp.get_finding(
     CHUB_SUMMARY_FILE, CHUB_DETAILED_FILE, "chub"
 )
-summary_df["MoveToTracker"] = pd.Series([False for x in range(len(summary_df.index))])
+summary_df["MoveToTracker"] = False
 
 # Output Findings Summary Table & Button to move findings to tracker
 st.markdown("### Findings Summary")
@@ -1,9 +1,8 @@
-import pandas as pd
 import streamlit as st
 import CostOptimizationDataPull as codp
 
-SEC2_SUMMARY_FILE = "/tmp/sec2_sum.parquet"
-SEC2_DETAILED_FILE = "/tmp/sec2_det.parquet"
+SEC2_SUMMARY_FILE = "/tmp/sec2_sum.arrow"
+SEC2_DETAILED_FILE = "/tmp/sec2_det.arrow"
 
 st.set_page_config(page_title="Stopped EC2 Findings", layout="wide")
 st.markdown("# Stopped EC2 Findings")
@@ -12,7 +11,7 @@ st.sidebar.header("Stopped EC2 Findings")
 summary_df, detailed_df = codp.get_finding(
     SEC2_SUMMARY_FILE, SEC2_DETAILED_FILE, "sec2"
 )
-summary_df["MoveToTracker"] = pd.Series([False for x in range(len(summary_df.index))])
+summary_df["MoveToTracker"] = False
 
 # Output Findings Summary Table & Button to move findings to tracker
 st.markdown("### Findings Summary")
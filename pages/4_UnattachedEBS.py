@@ -1,9 +1,8 @@
-import pandas as pd
 import streamlit as st
 import CostOptimizationDataPull as codp
 
-UEBS_SUMMARY_FILE = "/tmp/uebs_sum.parquet"
-UEBS_DETAILED_FILE = "/tmp/uebs_det.parquet"
+UEBS_SUMMARY_FILE = "/tmp/uebs_sum.arrow"
+UEBS_DETAILED_FILE = "/tmp/uebs_det.arrow"
 
 st.set_page_config(page_title="Unattached EBS Findings", layout="wide")
 st.markdown("# Unattached EBS Findings")
@@ -12,7 +11,7 @@ st.sidebar.header("Unattached EBS Findings")
 summary_df, detailed_df = codp.get_finding(
     UEBS_SUMMARY_FILE, UEBS_DETAILED_FILE, "uebs"
 )
-summary_df["MoveToTracker"] = pd.Series([False for x in range(len(summary_df.index))])
+summary_df["MoveToTracker"] = False
 
 # Output Findings Summary Table & Button to move findings to tracker
 st.markdown("### Findings Summary")
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 from streamlit import session_state as ss
@@ -6,19 +7,7 @@ from datetime import date
 from dateutil.relativedelta import relativedelta
 import altair as alt
 
-IDLE_STYPES = [
-    "unattached ebs",
-    "idle",
-    "idle rds",
-    "idle ec2",
-    "idle dms",
-    "idle lambda",
-    "stop",
-    "stopped ec2 instance",
-    "s3 lifecycle policy",
-]
-RESERVATION_STYPES = ["purchasereservedinstances", "purchasesavingsplans", "savinsplanspurchase"]
-RIGHTSIZE_STYPES = ["rightsize", "upgrade", "rightsize ebs", "rightsizing"]
+ROLLUP_CATEGORIES = ["Idle", "Reservations", "Rightsize", "Strategic Initiative"]
 
 st.set_page_config(page_title="Cost Savings Dashboards", layout="wide")
 
@@ -56,27 +45,19 @@ ROLL_COL_CONFIG = {
     ),
 }
 
-COL_CONFIG = {
-    "DateOfSavings": st.column_config.DateColumn(
-        "DateOfSavings", min_value=date(2022, 1, 1), format="MM-DD-YYYY", step=1
-    ),
-    "FinOpsLastModified": st.column_config.DateColumn(
-        "FinOpsLastModified", min_value=date(2022, 1, 1), format="MM-DD-YYYY", step=1
-    ),
-}
-
 
 st.markdown("# Cost Savings Dashboards")
 st.sidebar.header("Cost Savings Dashboards")
 
-ss.ctracker_df = codp.ingest_tracker(tracker_type="complete", s3=True)
+# Reuse the session copy across reruns until any session saves the tracker
+codp.load_session_tracker("complete")
 
 with st.form("Tracker_Form"):
     cetracker_df = st.data_editor(
         ss.ctracker_df,
         num_rows="fixed",
         hide_index=False,
-        column_config=COL_CONFIG,
+        column_config=codp.TRACKER_COL_CONFIG,
         key="cetracker",
     )
     ss.unwritten_undexes = st.form_submit_button(
@@ -84,60 +65,53 @@ with st.form("Tracker_Form"):
     )
 
 
-rollup_df = pd.DataFrame(
-    columns=["Date", "Idle", "Reservations",
-             "Rightsize", "Strategic Initiative"]
-)
-rollup_df.set_index("Date")
 now = date.today() - relativedelta(months=+1)
 dates = []
 for i in range(0, 12):
     dates.append(now - relativedelta(months=+i))
 
-rollup_df["Date"] = pd.to_datetime(rollup_df["Date"]).dt.strftime("%Y-%m")
-
-for d in dates:
-    idle = 0
-    rightsize = 0
-    reservation = 0
-    strat_init = 0
-    for i in range(0, 12):
-        roll_d = d - relativedelta(months=+i)
-        for index, row in ss.ctracker_df.iterrows():
-            if row["FinOpsStatus"].lower() == "complete":
-                if (
-                    roll_d.year == row["DateOfSavings"].year
-                    and roll_d.month == row["DateOfSavings"].month
-                ):
-                    if row["Savings Type"].lower() in IDLE_STYPES:
-                        idle += row["estimatedMonthlySavings"]
-                    elif row["Savings Type"].lower() in RESERVATION_STYPES:
-                        reservation += row["estimatedMonthlySavings"]
-                    elif row["Savings Type"].lower() in RIGHTSIZE_STYPES:
-                        rightsize += row["estimatedMonthlySavings"]
-                    else:
-                        strat_init += row["estimatedMonthlySavings"]
-
-    rollup_df.loc[d] = [d, idle, reservation, rightsize, strat_init]
-
-st.dataframe(rollup_df, column_config=ROLL_COL_CONFIG, hide_index=True)
-
-melt_df = pd.melt(
-    rollup_df, id_vars=["Date"], var_name="Savings Type", value_name="value"
+# Each row sums the completed savings of the 12 months ending at its date,
+# so bucket savings by month and category once and take a rolling sum
+complete_df = ss.ctracker_df[ss.ctracker_df["FinOpsStatus"].str.lower() == "complete"]
+stype = complete_df["Savings Type"].str.lower()
+# Categorical keys let the groupby work on integer codes, not strings
+category = pd.Categorical.from_codes(
+    np.select(
+        [
+            stype.isin(codp.IDLE_STYPES),
+            stype.isin(codp.RESERVATION_STYPES),
+            stype.isin(codp.RIGHTSIZE_STYPES),
+        ],
+        [0, 1, 2],
+        default=3,
+    ),
+    categories=ROLLUP_CATEGORIES,
+)
+month = pd.to_datetime(complete_df["DateOfSavings"]).dt.to_period("M")
+monthly = (
+    complete_df.groupby([month, category], observed=True)["estimatedMonthlySavings"]
+    .sum()
+    .unstack(fill_value=0)
+    .reindex(
+        index=pd.period_range(end=pd.Period(now, freq="M"), periods=23, freq="M"),
+        columns=ROLLUP_CATEGORIES,
+        fill_value=0,
+    )
 )
+# 12 month window sums from a running total: row i is cum[i] - cum[i - 12]
+cum = monthly.to_numpy().cumsum(axis=0)
+rolling = cum[11:] - np.vstack([np.zeros((1, cum.shape[1])), cum[:-12]])
 
-#c = (
-#    alt.Chart(melt_df)
-#    .mark_area()
-#    .encode(
-#        alt.X("Date:T", axis=alt.Axis(format="%B-%Y", tickSize=0)),
-#        alt.Y("value:Q").axis().title("Savings Amount $"),
-#        alt.Color("Savings Type:N"),
-#    )
-#)
+rollup_df = pd.DataFrame(rolling[::-1], columns=ROLLUP_CATEGORIES)
+rollup_df.insert(0, "Date", dates)
 
+st.dataframe(rollup_df, column_config=ROLL_COL_CONFIG, hide_index=True)
+
+# Vega-Lite folds the category columns into long form itself, so the
+# rollup is sent as is instead of a melted copy four times as long
 c = (
-    alt.Chart(melt_df)
+    alt.Chart(rollup_df)
+    .transform_fold(ROLLUP_CATEGORIES, as_=["Savings Type", "value"])
     .mark_area()
     .encode(
         alt.X("yearmonth(Date):T"),
@@ -149,12 +123,8 @@ c = (
 
 st.altair_chart(c)
 
-rollup_sum = (
-    rollup_df["Idle"].sum()
-    + rollup_df["Reservations"].sum()
-    + rollup_df["Rightsize"].sum()
-    + rollup_df["Strategic Initiative"].sum()
-)
+# rolling is the NumPy array behind the rollup_df category columns
+rollup_sum = float(rolling.sum())
 
 # st.write("Current Total of Tracker: $" + '{:.2f}'.format(rollup_sum))
 st.write(f"Current Total of Tracker: ${rollup_sum:,.2f}")
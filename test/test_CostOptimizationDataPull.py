@@ -1,8 +1,25 @@
 from CostOptimizationDataPull import split_inprogress_complete, DF_TYPE_DICT
+from CostOptimizationDataPull import calcost_ebs, calcost_ebs_vec
+from CostOptimizationDataPull import apply_tracker_edits, merge_tracker_edits
+from datetime import date, timedelta
 import numpy as np
 import pandas as pd
 import pytest
 
+
+def make_tracker():
+    """
+    Three row tracker last modified yesterday, as stored in S3
+    """
+    yesterday = date.today() - timedelta(days=1)
+    return pd.DataFrame({
+        'ResourceId': ['1', '2', '3'],
+        'FinOpsStatus': ['Needs Research', 'In Progress', 'In Progress'],
+        'FinOpsLastModified': [yesterday] * 3,
+        'Comments': ['a', 'b', 'c'],
+        'DateOfSavings': [yesterday] * 3,
+    })
+
 class TestCostoptimizationdatapull:
 
     def test_split_inprogress_complete_1(self):
@@ -167,4 +184,71 @@ class TestCostoptimizationdatapull:
             'FinOpsStatus': ['complete', np.nan],
         })
         with pytest.raises(AttributeError):
-            split_inprogress_complete(nan_df)
\ No newline at end of file
+            split_inprogress_complete(nan_df)
+
+    def test_calcost_ebs_vec_matches_calcost_ebs(self):
+        """
+        Test calcost_ebs_vec prices every volume type the same as calcost_ebs
+        """
+        volumes = [
+            ("gp2", None, None, 100),
+            ("gp3", 3000, 125, 100),
+            ("gp3", 6000, 250, 100),
+            ("st1", None, None, 500),
+            ("sc1", None, None, 500),
+            ("io1", 1000, None, 50),
+            ("io2", 20000, None, 50),
+            ("io2", 40000, None, 50),
+            ("io2", 70000, None, 50),
+            ("standard", None, None, 10),
+            ("unknown", None, None, 10),
+        ]
+        expected = [calcost_ebs(*volume) for volume in volumes]
+        result = calcost_ebs_vec(*zip(*volumes))
+        np.testing.assert_allclose(result, expected)
+
+    def test_apply_tracker_edits_writes_cleared_cells_and_parses_dates(self):
+        """
+        Test apply_tracker_edits writes None edits and parses DateOfSavings strings
+        """
+        df = make_tracker()
+        modified = apply_tracker_edits(df, {
+            0: {'Comments': None},
+            2: {'DateOfSavings': '2024-03-05', 'Comments': 'z'},
+        })
+
+        assert list(modified) == [0, 2]
+        assert pd.isna(df.loc[0, 'Comments'])
+        assert df.loc[2, 'Comments'] == 'z'
+        assert df.loc[2, 'DateOfSavings'] == date(2024, 3, 5)
+        assert df.loc[0, 'FinOpsLastModified'] == date.today()
+        assert df.loc[1, 'FinOpsLastModified'] == date.today() - timedelta(days=1)
+
+    def test_merge_tracker_edits_skips_newer_s3_rows(self):
+        """
+        Test merge_tracker_edits returns edits older than the S3 record as unwritten
+        """
+        local_df = make_tracker()
+        s3_df = make_tracker()
+        s3_df.loc[1, 'FinOpsLastModified'] = date.today() + timedelta(days=1)
+        s3_df.loc[1, 'Comments'] = 'newer'
+
+        s3_df, unwritten = merge_tracker_edits(
+            local_df, {0: {'Comments': 'x'}, 1: {'Comments': 'y'}}, s3_df
+        )
+
+        assert unwritten == [1]
+        assert s3_df.loc[0, 'Comments'] == 'x'
+        assert s3_df.loc[1, 'Comments'] == 'newer'
+
+    def test_merge_tracker_edits_drops_deleteme_rows(self):
+        """
+        Test merge_tracker_edits removes rows set to DeleteMe from the S3 copy
+        """
+        local_df = make_tracker()
+        s3_df, unwritten = merge_tracker_edits(
+            local_df, {1: {'FinOpsStatus': 'DeleteMe'}}, make_tracker()
+        )
+
+        assert unwritten == []
+        assert list(s3_df['ResourceId']) == ['1', '3']